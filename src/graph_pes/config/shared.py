@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, fields
-from typing import Any, Literal, Protocol, TypeVar
+from functools import lru_cache
+from types import ModuleType
+from typing import Any, Callable, Literal, Protocol, TypeVar
 
 import dacite
 import data2objects
@@ -21,16 +23,74 @@ T = TypeVar("T")
 
 
 def _nice_dict_repr(d: dict) -> str:
-    def _print_dict(d: dict, indent: int = 0) -> str:
-        nice = {
-            k: v
-            if not isinstance(v, dict)
-            else "\n" + _print_dict(v, indent + 1)
-            for k, v in d.items()
-        }
-        return "\n".join([f"{'  ' * indent}{k}: {v}" for k, v in nice.items()])
+    # collect all lines and join once at the end, rather than re-joining
+    # the (growing) string at every level of nesting
+    lines: list[str] = []
 
-    return _print_dict(d, 0)
+    def _walk(d: dict, indent: str):
+        for k, v in d.items():
+            if isinstance(v, dict):
+                lines.append(f"{indent}{k}:")
+                _walk(v, indent + "  ")
+            else:
+                lines.append(f"{indent}{k}: {v}")
+
+    _walk(d, "")
+    return "\n".join(lines)
+
+
+_SYMBOL_TABLE: ModuleType | None = None
+
+
+def _get_symbol_table() -> ModuleType:
+    """
+    A single module exposing every public name from the graph-pes modules
+    in which to look up non-fully qualified names in configs, so that
+    ``data2objects`` needs only one lookup per name. This is built lazily
+    (and only once) to avoid circular imports.
+
+    Note that:
+
+    * the table is a snapshot of these modules at the time of the first
+      config load: attributes added to them afterwards are not resolved.
+    * ``data2objects`` reports failed lookups using the table's name,
+      i.e. a single string listing all of these modules.
+    """
+    global _SYMBOL_TABLE
+    if _SYMBOL_TABLE is None:
+        import graph_pes
+        import graph_pes.data
+        import graph_pes.interfaces
+        import graph_pes.models
+        import graph_pes.training
+        import graph_pes.training.callbacks
+        import graph_pes.training.loss
+        import graph_pes.training.opt
+
+        # earlier modules take precedence over later ones
+        modules = [
+            graph_pes,
+            graph_pes.models,
+            graph_pes.training,
+            graph_pes.training.opt,
+            graph_pes.training.loss,
+            graph_pes.data,
+            graph_pes.training.callbacks,
+            graph_pes.interfaces,
+        ]
+        table = ModuleType(", ".join(m.__name__ for m in modules))
+        for module in modules:
+            for name in dir(module):
+                if not name.startswith("__"):
+                    table.__dict__.setdefault(name, getattr(module, name))
+        _SYMBOL_TABLE = table
+    return _SYMBOL_TABLE
+
+
+# bounded: TestingConfig.get_datasets creates a new config class per call
+@lru_cache(maxsize=32)
+def _field_names(config_class: type) -> frozenset[str]:
+    return frozenset(f.name for f in fields(config_class))
 
 
 class HasDefaults(Protocol):
@@ -49,34 +109,11 @@ def instantiate_config_from_dict(
     config_dict = nested_merge(config_class.defaults(), config_dict)
     final_dict: dict = data2objects.fill_referenced_parts(config_dict)  # type: ignore
 
-    import graph_pes
-    import graph_pes.data
-    import graph_pes.interfaces
-    import graph_pes.models
-    import graph_pes.training
-    import graph_pes.training.callbacks
-    import graph_pes.training.loss
-    import graph_pes.training.opt
-
     object_dict = data2objects.from_dict(
-        final_dict,
-        modules=[
-            graph_pes,
-            graph_pes.models,
-            graph_pes.training,
-            graph_pes.training.opt,
-            graph_pes.training.loss,
-            graph_pes.data,
-            graph_pes.training.callbacks,
-            graph_pes.interfaces,
-        ],
+        final_dict, modules=[_get_symbol_table()]
     )
-    field_names = {f.name for f in fields(config_class)}  # type: ignore
-    object_dict = {
-        k: v
-        for k, v in object_dict.items()
-        if k in field_names  # type: ignore
-    }
+    field_names = _field_names(config_class)  # type: ignore
+    object_dict = {k: v for k, v in object_dict.items() if k in field_names}
 
     try:
         return (
@@ -115,25 +152,42 @@ class TorchConfig:
     """  # noqa: E501
 
 
+def _model_from_dict(
+    model: dict[str, GraphPropertyModel],
+) -> GraphPropertyModel:
+    # try to build an AdditionModel or TensorAdditionModel
+    if all(isinstance(m, GraphPESModel) for m in model.values()):
+        return AdditionModel(**model)
+    elif all(isinstance(m, GraphTensorModel) for m in model.values()):
+        return TensorAdditionModel(**model)
+    else:
+        _types = {k: type(v) for k, v in model.items()}
+        raise ValueError(
+            "Expected all values in the model dictionary to be "
+            "GraphPropertyModel instances, but got something else: "
+            f"types: {_types}\n"
+            f"values: {model}\n"
+        )
+
+
+@lru_cache(maxsize=None)
+def _model_parser(
+    model_type: type,
+) -> Callable[[Any], GraphPropertyModel] | None:
+    # resolved once per type, so that repeated parsing is a single lookup
+    if issubclass(model_type, GraphPropertyModel):
+        return lambda model: model
+    elif issubclass(model_type, dict):
+        return _model_from_dict
+    return None
+
+
 def parse_model(
     model: GraphPropertyModel | dict[str, GraphPropertyModel],
 ) -> GraphPropertyModel:
-    if isinstance(model, GraphPropertyModel):
-        return model
-    elif isinstance(model, dict):
-        # try to build an AdditionModel or TensorAdditionModel
-        if all(isinstance(m, GraphPESModel) for m in model.values()):
-            return AdditionModel(**model)
-        elif all(isinstance(m, GraphTensorModel) for m in model.values()):
-            return TensorAdditionModel(**model)
-        else:
-            _types = {k: type(v) for k, v in model.items()}
-            raise ValueError(
-                "Expected all values in the model dictionary to be "
-                "GraphPropertyModel instances, but got something else: "
-                f"types: {_types}\n"
-                f"values: {model}\n"
-            )
+    parser = _model_parser(type(model))
+    if parser is not None:
+        return parser(model)
     raise ValueError(
         "Expected to be able to parse a GraphPropertyModel or a "
         "dictionary of named GraphPropertyModel from the model config, "
@@ -141,17 +195,26 @@ def parse_model(
     )
 
 
+@lru_cache(maxsize=None)
+def _loss_parser(loss_type: type) -> Callable[[Any], TotalLoss] | None:
+    # resolved once per type, so that repeated parsing is a single lookup
+    if issubclass(loss_type, Loss):
+        return lambda loss: TotalLoss([loss])
+    elif issubclass(loss_type, TotalLoss):
+        return lambda loss: loss
+    elif issubclass(loss_type, dict):
+        return lambda loss: TotalLoss(list(loss.values()))
+    elif issubclass(loss_type, list):
+        return TotalLoss
+    return None
+
+
 def parse_loss(
     loss: Loss | TotalLoss | dict[str, Loss] | list[Loss],
 ) -> TotalLoss:
-    if isinstance(loss, Loss):
-        return TotalLoss([loss])
-    elif isinstance(loss, TotalLoss):
-        return loss
-    elif isinstance(loss, dict):
-        return TotalLoss(list(loss.values()))
-    elif isinstance(loss, list):
-        return TotalLoss(loss)
+    parser = _loss_parser(type(loss))
+    if parser is not None:
+        return parser(loss)
     raise ValueError(
         "Expected to be able to parse a Loss, TotalLoss, a list of "
         "Loss instances, or a dictionary mapping keys to Loss instances from "
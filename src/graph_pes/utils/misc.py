@@ -187,18 +187,21 @@ def nested_merge(a: dict, b: dict):
     over `a`.
     """
 
+    # copy once here, rather than at every level of the recursion
     new_dict = copy.deepcopy(a)
+    _nested_merge_inplace(new_dict, b)
+    return new_dict
+
+
+def _nested_merge_inplace(a: dict, b: dict):
     for key, value in b.items():
-        if (
-            key in new_dict
-            and isinstance(value, dict)
-            and isinstance(new_dict[key], dict)
-        ):
-            new_dict[key] = nested_merge(new_dict[key], value)
+        if key in a and isinstance(value, dict) and isinstance(a[key], dict):
+            # deepcopy preserves shared references (e.g. YAML aliases), so
+            # give each sub-dict we merge into its own (shallow) container
+            a[key] = dict(a[key])
+            _nested_merge_inplace(a[key], value)
         else:
-            new_dict[key] = value
-
-    return new_dict
+            a[key] = value
 
 
 def build_single_nested_dict(keys: list[str], value: Any) -> dict:
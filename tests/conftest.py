@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from typing import Callable
+
+import pytest
+
+from graph_pes.graph_pes_model import GraphPESModel
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _seed():
+    import pytorch_lightning
+
+    pytorch_lightning.seed_everything(42)
+
+
+@pytest.fixture
+def model(request: pytest.FixtureRequest) -> GraphPESModel:
+    """
+    Instantiate the model factory passed (indirectly) by
+    ``helpers.parameterise_all_models``.
+    """
+    factory: Callable[[], GraphPESModel] = request.param
+    return factory()
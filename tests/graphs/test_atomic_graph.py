@@ -42,10 +42,14 @@ STRUCTURES = [
     RANDOM_STRUCTURE,
     CHARGED_STRUCTURE,
 ]
-GRAPHS = [AtomicGraph.from_ase(s, cutoff=1.0) for s in STRUCTURES]
 
 
-@pytest.mark.parametrize("structure, graph", zip(STRUCTURES, GRAPHS))
+@pytest.fixture
+def graph(structure: Atoms) -> AtomicGraph:
+    return AtomicGraph.from_ase(structure, cutoff=1.0)
+
+
+@pytest.mark.parametrize("structure", STRUCTURES)
 def test_general(structure: Atoms, graph: AtomicGraph):
     assert number_of_atoms(graph) == len(structure)
 
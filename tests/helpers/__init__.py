@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import inspect
 import os
 from pathlib import Path
@@ -7,7 +8,6 @@ from typing import Callable
 
 import ase.build
 import pytest
-import pytorch_lightning
 import torch
 from ase import Atoms
 from ase.io import read
@@ -42,7 +42,20 @@ def all_model_factories(
     expected_elements: list[str],
     cutoff: float,
 ) -> tuple[list[str], list[Callable[[], GraphPESModel]]]:
-    pytorch_lightning.seed_everything(42)
+    # normalise the cutoff so that e.g. 3 and 3.0 don't share cached
+    # factories that would build models with different cutoff dtypes
+    names, factories = _all_model_factories(
+        tuple(expected_elements), float(cutoff)
+    )
+    return list(names), list(factories)
+
+
+@functools.lru_cache(maxsize=None)
+def _all_model_factories(
+    expected_elements: tuple[str, ...],
+    cutoff: float,
+) -> tuple[tuple[str, ...], tuple[Callable[[], GraphPESModel], ...]]:
+    elements = list(expected_elements)
     # make these models as small as possible to speed up tests
     _small_nequip = {
         "layers": 2,
@@ -53,10 +66,10 @@ def all_model_factories(
         ),
     }
     required_kwargs = {
-        NequIP: {"elements": expected_elements, **_small_nequip},
+        NequIP: {"elements": elements, **_small_nequip},
         ZEmbeddingNequIP: {**_small_nequip},
         MACE: {
-            "elements": expected_elements,
+            "elements": elements,
             "layers": 3,
             "l_max": 2,
             "correlation": 3,
@@ -78,7 +91,7 @@ def all_model_factories(
             "radial_features": 24,
             "channels": 8,
         },
-        EDDP: {"elements": expected_elements},
+        EDDP: {"elements": elements},
     }
 
     def _model_factory(
@@ -103,22 +116,37 @@ def all_model_factories(
             lj=LennardJones(cutoff=cutoff), offset=FixedOffset()
         )
     )
-    return names, factories
+    return tuple(names), tuple(_seeded(factory) for factory in factories)
+
+
+def _seeded(
+    factory: Callable[[], GraphPESModel],
+) -> Callable[[], GraphPESModel]:
+    # seed locally so that each model is initialised deterministically,
+    # independent of the order in which the factories are called
+    def seeded_factory() -> GraphPESModel:
+        torch.manual_seed(42)
+        return factory()
+
+    return seeded_factory
 
 
 def all_models(
     expected_elements: list[str],
     cutoff: float,
 ) -> tuple[list[str], list[GraphPESModel]]:
-    torch.manual_seed(42)
     names, factories = all_model_factories(expected_elements, cutoff)
     return names, [factory() for factory in factories]
 
 
 def parameterise_all_models(expected_elements: list[str], cutoff: float = 5.0):
+    # pass the factories as parameters, and let the `model` fixture in
+    # conftest.py instantiate them lazily, once per test
     def decorator(func):
-        names, models = all_models(expected_elements, cutoff)
-        return pytest.mark.parametrize("model", models, ids=names)(func)
+        names, factories = all_model_factories(expected_elements, cutoff)
+        return pytest.mark.parametrize(
+            "model", factories, ids=names, indirect=True
+        )(func)
 
     return decorator
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import ase.build
 import numpy as np
+import pytest
 import torch
 from ase import Atoms
 
@@ -9,17 +10,24 @@ from graph_pes import AtomicGraph
 from graph_pes.atomic_graph import get_cell_volume, number_of_edges, to_batch
 from graph_pes.models.pairwise import LennardJones
 
-no_pbc = AtomicGraph.from_ase(
-    Atoms("H2", positions=[(0, 0, 0), (0, 0, 1)], pbc=False),
-    cutoff=1.5,
-)
-pbc = AtomicGraph.from_ase(
-    Atoms("H2", positions=[(0, 0, 0), (0, 0, 1)], pbc=True, cell=(2, 2, 2)),
-    cutoff=1.5,
-)
 
+@pytest.fixture(scope="module")
+def no_pbc() -> AtomicGraph:
+    return AtomicGraph.from_ase(
+        Atoms("H2", positions=[(0, 0, 0), (0, 0, 1)], pbc=False),
+        cutoff=1.5,
+    )
 
-def test_predictions():
+
+@pytest.fixture(scope="module")
+def pbc() -> AtomicGraph:
+    return AtomicGraph.from_ase(
+        Atoms("H2", positions=[(0, 0, 0), (0, 0, 1)], pbc=True, cell=(2, 2, 2)),
+        cutoff=1.5,
+    )
+
+
+def test_predictions(no_pbc: AtomicGraph, pbc: AtomicGraph):
     expected_shapes = {
         "energy": (),
         "forces": (2, 3),
@@ -51,7 +59,7 @@ def test_predictions():
         assert predictions[key].shape == expected_shapes[key]
 
 
-def test_batched_prediction():
+def test_batched_prediction(pbc: AtomicGraph):
     batch = to_batch([pbc, pbc])
 
     expected_shapes = {
@@ -1,3 +1,6 @@
+from dataclasses import dataclass
+from typing import Any
+
 import pytest
 import torch
 import yaml
@@ -8,7 +11,7 @@ from graph_pes.config.shared import (
     parse_model,
 )
 from graph_pes.config.training import TrainingConfig
-from graph_pes.models import SchNet
+from graph_pes.models import LennardJones, SchNet
 from graph_pes.models.addition import AdditionModel
 from graph_pes.training.loss import ForceRMSE, PerAtomEnergyLoss, TotalLoss
 from graph_pes.utils.misc import nested_merge
@@ -131,6 +134,32 @@ def test_extra_keys():
     assert "extra_key" in final_data
 
 
+def test_short_names():
+    # short names should resolve against the graph-pes modules
+    # without needing any (downloaded) training data
+    @dataclass
+    class DummyConfig:
+        model: Any
+        loss: Any
+
+        @classmethod
+        def defaults(cls) -> dict:
+            return {}
+
+    _, config = instantiate_config_from_dict(
+        {
+            "model": {"+LennardJones": {"cutoff": 3.0}},
+            "loss": "+PerAtomEnergyLoss()",
+        },
+        DummyConfig,
+    )
+    assert isinstance(config.model, LennardJones)
+    assert isinstance(config.loss, PerAtomEnergyLoss)
+
+    with pytest.raises(ImportError, match="Nope"):
+        instantiate_config_from_dict({"model": "+Nope()"}, DummyConfig)
+
+
 def test_parse_loss():
     # 1. a single loss should be wrapped in a TotalLoss
     loss = PerAtomEnergyLoss()
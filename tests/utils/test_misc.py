@@ -3,6 +3,7 @@ from __future__ import annotations
 import numpy as np
 import pytest
 import torch
+import yaml
 
 from graph_pes.utils.misc import (
     as_possible_tensor,
@@ -69,6 +70,25 @@ def test_nested_merge():
     assert a == {"a": 1, "b": {"c": 2}, "d": 3}, "nested_merge mutated a"
     assert b == {"a": 3, "b": {"c": 4}}, "nested_merge mutated b"
 
+    # deeply nested dictionaries should also be left untouched
+    a = {"a": {"b": {"c": {"d": 1}}}}
+    b = {"a": {"b": {"c": {"e": 2}}}}
+    c = nested_merge(a, b)
+    assert c == {"a": {"b": {"c": {"d": 1, "e": 2}}}}
+    assert a == {"a": {"b": {"c": {"d": 1}}}}, "nested_merge mutated a"
+    assert b == {"a": {"b": {"c": {"e": 2}}}}, "nested_merge mutated b"
+
+    # merging into an aliased sub-dict should not affect its siblings
+    a = yaml.safe_load("""
+    common: &c {lr: 0.1, nested: {x: 1}}
+    train: *c
+    valid: *c
+    """)
+    c = nested_merge(a, {"train": {"lr": 0.5, "nested": {"x": 2}}})
+    assert c["train"] == {"lr": 0.5, "nested": {"x": 2}}
+    assert c["common"] == {"lr": 0.1, "nested": {"x": 1}}
+    assert c["valid"] == {"lr": 0.1, "nested": {"x": 1}}
+
 
 def test_build_single_nested_dict():
     assert build_single_nested_dict(["a", "b", "c"], 4) == {